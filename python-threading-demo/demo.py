@@ -14,6 +14,7 @@ if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
 from basic_thread_demo import BasicThreadDemo
+from main import setup_logging
 
 
 def quick_demo():
@@ -35,4 +36,5 @@ def quick_demo():
 
 
 if __name__ == "__main__":
+    setup_logging()
     quick_demo()
\ No newline at end of file
@@ -5,9 +5,13 @@ Python多线程演示系统主程序
 
 import sys
 import os
+import functools
+import importlib
+import logging
 import time
 from typing import Dict, Any
 import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
 
 # 添加src目录到路径
@@ -15,111 +19,133 @@ src_path = os.path.join(os.path.dirname(__file__), 'src')
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from basic_thread_demo import BasicThreadDemo
-from thread_pool_demo import ThreadPoolDemo
-from producer_consumer_demo import ProducerConsumerDemo
-from thread_sync_demo import ThreadSyncDemo
-from file_downloader import demo_file_downloader
-from data_processor import demo_sales_data_processing, demo_log_data_processing
+
+# 演示配置（模块级常量，避免每次构造ThreadingDemoSystem时重建）
+# 'module' 为src下的模块名，'class'/'function' 为入口名称，在演示被选中时才导入
+_DEMOS = {
+    '1': {
+        'name': '基础线程演示',
+        'description': '展示Python threading模块的基本使用方法',
+        'module': 'basic_thread_demo',
+        'class': 'BasicThreadDemo',
+        'icon': '🧵'
+    },
+    '2': {
+        'name': '线程池演示',
+        'description': '展示concurrent.futures模块的ThreadPoolExecutor使用',
+        'module': 'thread_pool_demo',
+        'class': 'ThreadPoolDemo',
+        'icon': '⚡'
+    },
+    '3': {
+        'name': '生产者消费者演示',
+        'description': '实现经典的生产者消费者模式，展示线程间通信',
+        'module': 'producer_consumer_demo',
+        'class': 'ProducerConsumerDemo',
+        'icon': '🏭'
+    },
+    '4': {
+        'name': '线程同步演示',
+        'description': '展示各种线程同步原语的使用，确保线程安全',
+        'module': 'thread_sync_demo',
+        'class': 'ThreadSyncDemo',
+        'icon': '🔒'
+    },
+    '5': {
+        'name': '文件下载器',
+        'description': '并发下载多个文件的实际应用场景',
+        'module': 'file_downloader',
+        'class': None,  # 使用函数
+        'function': 'demo_file_downloader',
+        'icon': '📥'
+    },
+    '6': {
+        'name': '数据处理器',
+        'description': '大数据集并行处理的实际应用场景',
+        'module': 'data_processor',
+        'class': None,  # 使用函数
+        'function': 'demo_sales_data_processing',
+        'icon': '📊'
+    },
+    '7': {
+        'name': '日志分析器',
+        'description': '日志数据并行分析处理',
+        'module': 'data_processor',
+        'class': None,  # 使用函数
+        'function': 'demo_log_data_processing',
+        'icon': '📋'
+    }
+}
+
+
+def _load_demo_entry(module_name: str, attr_name: str):
+    """按需导入演示模块并返回入口（类或函数），已导入的模块由sys.modules复用"""
+    return getattr(importlib.import_module(module_name), attr_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_system_info() -> Dict[str, Any]:
+    """获取系统信息（进程内只采集一次）"""
+    try:
+        # 直接读取物理页数，避免导入psutil
+        memory_total = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024**3)  # GB
+    except (AttributeError, ValueError, OSError):
+        memory_total = 8  # 默认8GB（如Windows不支持sysconf）
+    
+    return {
+        'python_version': sys.version,
+        'cpu_count': os.cpu_count(),
+        'memory_total': memory_total,
+        'platform': sys.platform
+    }
 
 
 class ThreadingDemoSystem:
     """Python多线程演示系统主类"""
     
-    def __init__(self):
-        self.demos = {
-            '1': {
-                'name': '基础线程演示',
-                'description': '展示Python threading模块的基本使用方法',
-                'class': BasicThreadDemo,
-                'icon': '🧵'
-            },
-            '2': {
-                'name': '线程池演示',
-                'description': '展示concurrent.futures模块的ThreadPoolExecutor使用',
-                'class': ThreadPoolDemo,
-                'icon': '⚡'
-            },
-            '3': {
-                'name': '生产者消费者演示',
-                'description': '实现经典的生产者消费者模式，展示线程间通信',
-                'class': ProducerConsumerDemo,
-                'icon': '🏭'
-            },
-            '4': {
-                'name': '线程同步演示',
-                'description': '展示各种线程同步原语的使用，确保线程安全',
-                'class': ThreadSyncDemo,
-                'icon': '🔒'
-            },
-            '5': {
-                'name': '文件下载器',
-                'description': '并发下载多个文件的实际应用场景',
-                'class': None,  # 使用函数
-                'function': demo_file_downloader,
-                'icon': '📥'
-            },
-            '6': {
-                'name': '数据处理器',
-                'description': '大数据集并行处理的实际应用场景',
-                'class': None,  # 使用函数
-                'function': demo_sales_data_processing,
-                'icon': '📊'
-            },
-            '7': {
-                'name': '日志分析器',
-                'description': '日志数据并行分析处理',
-                'class': None,  # 使用函数
-                'function': demo_log_data_processing,
-                'icon': '📋'
-            }
-        }
-        
-        self.system_info = self._get_system_info()
+    # 只有线程池演示包含真正的CPU密集型计算（batch_processing求素数），并行模式下放到独立进程；
+    # 其余演示的耗时主要在sleep/等待上（等待期间释放GIL），在当前进程中并发运行即可
+    CPU_BOUND_DEMOS = ('2',)
     
-    def _get_system_info(self) -> Dict[str, Any]:
-        """获取系统信息"""
-        try:
-            import psutil
-            memory_total = psutil.virtual_memory().total // (1024**3)  # GB
-        except ImportError:
-            memory_total = 8  # 默认8GB
-        
-        return {
-            'python_version': sys.version,
-            'cpu_count': os.cpu_count(),
-            'memory_total': memory_total,
-            'platform': sys.platform,
+    def __init__(self, quiet: bool = False):
+        self.demos = _DEMOS
+        self.quiet = quiet
+        self.system_info = {
+            **_get_system_info(),
             'current_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
     
     def print_header(self):
         """打印系统头部信息"""
-        print("=" * 80)
-        print("🐍 Python 多线程演示系统")
-        print("=" * 80)
-        print(f"🖥️  系统信息:")
-        print(f"   Python版本: {self.system_info['python_version'].split()[0]}")
-        print(f"   CPU核心数: {self.system_info['cpu_count']}")
-        print(f"   系统内存: {self.system_info['memory_total']} GB")
-        print(f"   运行平台: {self.system_info['platform']}")
-        print(f"   当前时间: {self.system_info['current_time']}")
-        print(f"   活跃线程数: {threading.active_count()}")
-        print("=" * 80)
+        lines = [
+            "=" * 80,
+            "🐍 Python 多线程演示系统",
+            "=" * 80,
+            "🖥️  系统信息:",
+            f"   Python版本: {self.system_info['python_version'].split()[0]}",
+            f"   CPU核心数: {self.system_info['cpu_count']}",
+            f"   系统内存: {self.system_info['memory_total']} GB",
+            f"   运行平台: {self.system_info['platform']}",
+            f"   当前时间: {self.system_info['current_time']}",
+            f"   活跃线程数: {threading.active_count()}",
+            "=" * 80,
+        ]
+        # 一次性输出，减少多次print带来的加锁和写入开销
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def print_menu(self):
         """打印主菜单"""
-        print("\n📋 请选择要运行的演示:")
-        print("-" * 60)
+        lines = ["\n📋 请选择要运行的演示:", "-" * 60]
         
         for key, demo in self.demos.items():
-            print(f"  {key}. {demo['icon']} {demo['name']}")
-            print(f"     {demo['description']}")
-            print()
+            lines.append(f"  {key}. {demo['icon']} {demo['name']}")
+            lines.append(f"     {demo['description']}")
+            lines.append("")
         
-        print("  0. 🚀 运行所有演示")
-        print("  q. 🚪 退出系统")
-        print("-" * 60)
+        lines.append("  0. 🚀 运行所有演示")
+        lines.append("  q. 🚪 退出系统")
+        lines.append("-" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def run_demo(self, demo_key: str) -> bool:
         """运行指定的演示"""
@@ -132,21 +158,22 @@ class ThreadingDemoSystem:
         print(f"\n{demo['icon']} 启动演示: {demo['name']}")
         print("=" * 80)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             if demo['class']:
                 # 使用类的方式
-                demo_instance = demo['class']()
+                demo_class = _load_demo_entry(demo['module'], demo['class'])
+                demo_instance = demo_class()
                 demo_instance.run_all_demos()
             elif 'function' in demo:
                 # 使用函数的方式
-                demo['function']()
+                _load_demo_entry(demo['module'], demo['function'])()
             else:
                 print(f"❌ 演示配置错误: {demo['name']}")
                 return False
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             print(f"\n✅ 演示完成: {demo['name']}")
             print(f"⏱️  总耗时: {end_time - start_time:.2f}秒")
@@ -162,43 +189,88 @@ class ThreadingDemoSystem:
             print(f"错误详情: {e}")
             return False
     
-    def run_all_demos(self):
-        """运行所有演示"""
-        print(f"\n🚀 开始运行所有演示")
+    def _run_io_bound_demos(self, keys: list) -> list:
+        """在线程池中并发运行以等待为主的演示，返回各演示的执行结果"""
+        if not keys:
+            return []
+        print(f"\n⚡ 并行运行等待密集型演示: {', '.join(keys)}")
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            return list(executor.map(self.run_demo, keys))
+    
+    def _run_demos_parallel(self, keys: list) -> list:
+        """并行运行演示：CPU密集型演示分发到进程池（各自独立的GIL），
+        其余以等待为主的演示同时在当前进程的线程池中运行"""
+        cpu_keys = [key for key in keys if key in self.CPU_BOUND_DEMOS]
+        io_keys = [key for key in keys if key not in self.CPU_BOUND_DEMOS]
+        
+        print(f"\n🧩 多进程运行CPU密集型演示: {', '.join(cpu_keys)}")
+        # spawn方式启动的子进程不会继承主进程的日志配置，通过initializer重新配置
+        with ProcessPoolExecutor(max_workers=max(1, len(cpu_keys)),
+                                 initializer=setup_logging,
+                                 initargs=(self.quiet,)) as executor:
+            cpu_results = executor.map(_run_demo_by_key, cpu_keys)
+            io_results = self._run_io_bound_demos(io_keys)
+            return io_results + list(cpu_results)
+    
+    def run_all_demos(self, parallel: bool = False):
+        """运行所有演示
+        
+        Args:
+            parallel: 为True时CPU密集型演示在多进程中运行，其余演示在线程中并发运行
+        """
+        print(f"\n🚀 开始运行所有演示{'（并行模式）' if parallel else ''}")
         print("=" * 80)
         
-        total_start_time = time.time()
+        total_start_time = time.perf_counter()
         successful_demos = 0
         failed_demos = 0
+        baseline_threads = threading.active_count()
+        keys = sorted(self.demos.keys())
         
-        for key in sorted(self.demos.keys()):
-            demo = self.demos[key]
-            
-            print(f"\n{'='*20} 演示 {key}/{len(self.demos)}: {demo['name']} {'='*20}")
-            
-            if self.run_demo(key):
-                successful_demos += 1
-            else:
-                failed_demos += 1
-            
-            # 演示间暂停
-            if key != max(self.demos.keys()):
-                print(f"\n⏸️  暂停3秒后继续下一个演示...")
-                time.sleep(3)
+        if parallel:
+            for success in self._run_demos_parallel(keys):
+                if success:
+                    successful_demos += 1
+                else:
+                    failed_demos += 1
+        else:
+            last_key = keys[-1]
+            for key in keys:
+                demo = self.demos[key]
+                
+                print(f"\n{'='*20} 演示 {key}/{len(self.demos)}: {demo['name']} {'='*20}")
+                
+                if self.run_demo(key):
+                    successful_demos += 1
+                else:
+                    failed_demos += 1
+                
+                # 等待上一个演示遗留的线程退出，避免输出混在下一个演示中
+                if key != last_key:
+                    self._wait_for_threads(baseline_threads)
         
-        total_end_time = time.time()
+        total_end_time = time.perf_counter()
         
         # 总结
-        print(f"\n🎯 所有演示执行完成")
-        print("=" * 80)
-        print(f"📊 执行统计:")
-        print(f"   总演示数: {len(self.demos)}")
-        print(f"   成功演示: {successful_demos}")
-        print(f"   失败演示: {failed_demos}")
-        print(f"   成功率: {(successful_demos / len(self.demos)) * 100:.1f}%")
-        print(f"   总耗时: {total_end_time - total_start_time:.2f}秒")
-        print(f"   最终活跃线程数: {threading.active_count()}")
-        print("=" * 80)
+        lines = [
+            "\n🎯 所有演示执行完成",
+            "=" * 80,
+            "📊 执行统计:",
+            f"   总演示数: {len(self.demos)}",
+            f"   成功演示: {successful_demos}",
+            f"   失败演示: {failed_demos}",
+            f"   成功率: {(successful_demos / len(self.demos)) * 100:.1f}%",
+            f"   总耗时: {total_end_time - total_start_time:.2f}秒",
+            f"   最终活跃线程数: {threading.active_count()}",
+            "=" * 80,
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def _wait_for_threads(self, baseline: int, timeout: float = 1.0) -> None:
+        """等待活跃线程数回落到基线，最多等待timeout秒"""
+        deadline = time.perf_counter() + timeout
+        while threading.active_count() > baseline and time.perf_counter() < deadline:
+            time.sleep(0.05)
     
     def interactive_mode(self):
         """交互模式"""
@@ -235,27 +307,37 @@ class ThreadingDemoSystem:
                 print(f"❌ 输入处理错误: {e}")
                 continue
     
-    def command_line_mode(self, demo_keys: list):
+    def command_line_mode(self, demo_keys: list, parallel: bool = False):
         """命令行模式"""
         self.print_header()
         
         print(f"🎯 命令行模式 - 运行指定演示: {', '.join(demo_keys)}")
         
+        if parallel and 'all' not in demo_keys:
+            print("⚠️  --parallel 仅在运行所有演示(all)时生效，指定的演示将按顺序运行")
+        
         for demo_key in demo_keys:
             if demo_key == 'all':
-                self.run_all_demos()
+                self.run_all_demos(parallel=parallel)
             elif demo_key in self.demos:
                 self.run_demo(demo_key)
             else:
                 print(f"❌ 无效的演示选择: {demo_key}")
 
 
+def _run_demo_by_key(demo_key: str) -> bool:
+    """在子进程中运行指定演示（模块级函数，便于进程池序列化）"""
+    return ThreadingDemoSystem().run_demo(demo_key)
+
+
 def print_usage():
     """打印使用说明"""
     print("使用方法:")
     print("  python main.py                    # 交互模式")
     print("  python main.py all                # 运行所有演示")
     print("  python main.py 1 2 3             # 运行指定的演示")
+    print("  python main.py all --parallel    # 并行运行所有演示（多进程+多线程，仅对all生效）")
+    print("  python main.py 1 --quiet         # 隐藏基础线程演示的工作线程日志")
     print("  python main.py --help            # 显示帮助")
     print()
     print("演示列表:")
@@ -272,9 +354,24 @@ def print_usage():
         print(f"  {key}: {name}")
 
 
+def setup_logging(quiet: bool = False) -> None:
+    """配置工作线程日志输出到标准输出（目前只有基础线程演示通过logging输出工作线程日志）"""
+    logging.basicConfig(
+        level=logging.WARNING if quiet else logging.INFO,
+        format='[%(asctime)s] %(message)s',
+        datefmt='%H:%M:%S',
+        stream=sys.stdout
+    )
+
+
 def main():
     """主函数"""
-    system = ThreadingDemoSystem()
+    quiet = '--quiet' in sys.argv[1:]
+    if quiet:
+        sys.argv.remove('--quiet')
+    setup_logging(quiet)
+    
+    system = ThreadingDemoSystem(quiet=quiet)
     
     # 解析命令行参数
     if len(sys.argv) == 1:
@@ -285,8 +382,9 @@ def main():
         print_usage()
     else:
         # 命令行模式
-        demo_keys = sys.argv[1:]
-        system.command_line_mode(demo_keys)
+        parallel = '--parallel' in sys.argv[1:]
+        demo_keys = [arg for arg in sys.argv[1:] if arg != '--parallel']
+        system.command_line_mode(demo_keys, parallel=parallel)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,19 @@
 展示Python threading模块的基本使用方法
 """
 
+import logging
+import sys
 import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Any, Callable, Dict
 
+# 工作线程日志：使用%格式延迟格式化，日志级别被过滤时不产生字符串开销
+# 模块只获取日志器，输出目标和格式由入口脚本（main.py、demo.py、本模块main()）配置
+logger = logging.getLogger(__name__)
+
 
 class BasicThreadDemo:
     """基础线程操作演示类"""
@@ -25,9 +32,9 @@ class BasicThreadDemo:
         
         def worker(thread_name: str, delay: float):
             """工作线程函数"""
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] 线程 {thread_name} 开始工作")
+            logger.info("线程 %s 开始工作", thread_name)
             time.sleep(delay)
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] 线程 {thread_name} 完成工作")
+            logger.info("线程 %s 完成工作", thread_name)
         
         # 创建多个线程
         threads = []
@@ -38,7 +45,7 @@ class BasicThreadDemo:
             threads.append(thread)
         
         # 启动所有线程
-        start_time = time.time()
+        start_time = time.perf_counter()
         for thread in threads:
             thread.start()
             print(f"✅ 启动线程: {thread.name}")
@@ -47,7 +54,7 @@ class BasicThreadDemo:
         for thread in threads:
             thread.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         print(f"\n⏱️  所有线程完成，总耗时: {end_time - start_time:.2f}秒")
     
     def thread_with_params(self) -> None:
@@ -58,8 +65,9 @@ class BasicThreadDemo:
         
         def calculate_sum(start: int, end: int, thread_id: str):
             """计算指定范围内数字的和"""
-            print(f"[{thread_id}] 开始计算 {start} 到 {end} 的和")
-            total = sum(range(start, end + 1))
+            logger.info("[%s] 开始计算 %d 到 %d 的和", thread_id, start, end)
+            # 等差数列求和公式，O(1) 计算，无需逐个累加
+            total = (end - start + 1) * (start + end) // 2
             
             with self.results_lock:
                 self.results.append({
@@ -69,7 +77,7 @@ class BasicThreadDemo:
                     'timestamp': datetime.now()
                 })
             
-            print(f"[{thread_id}] 计算完成: {total}")
+            logger.info("[%s] 计算完成: %d", thread_id, total)
         
         # 清空之前的结果
         self.results.clear()
@@ -92,14 +100,14 @@ class BasicThreadDemo:
             threads.append(thread)
         
         # 启动并等待所有线程
-        start_time = time.time()
+        start_time = time.perf_counter()
         for thread in threads:
             thread.start()
         
         for thread in threads:
             thread.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 显示结果
         print(f"\n📊 计算结果汇总:")
@@ -119,7 +127,7 @@ class BasicThreadDemo:
         
         def fetch_data(url_id: int, delay: float) -> Dict[str, Any]:
             """模拟数据获取"""
-            print(f"[Fetcher-{url_id}] 开始获取数据...")
+            logger.info("[Fetcher-%d] 开始获取数据...", url_id)
             time.sleep(delay)  # 模拟网络延迟
             
             # 模拟返回数据
@@ -131,47 +139,33 @@ class BasicThreadDemo:
                 'status': 'success'
             }
             
-            print(f"[Fetcher-{url_id}] 数据获取完成")
+            logger.info("[Fetcher-%d] 数据获取完成", url_id)
             return data
         
-        # 使用列表和锁来收集结果
+        # 创建多个数据获取任务
+        tasks = [(i, random.uniform(0.5, 2.0)) for i in range(1, 6)]
         results = []
-        results_lock = threading.Lock()
-        
-        def worker_wrapper(url_id: int, delay: float):
-            """工作线程包装器"""
-            try:
-                result = fetch_data(url_id, delay)
-                with results_lock:
-                    results.append(result)
-            except Exception as e:
-                with results_lock:
+        
+        start_time = time.perf_counter()
+        
+        # 通过Future获取返回值和异常，无需包装函数和结果锁
+        with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="Fetcher") as executor:
+            future_to_url = {
+                executor.submit(fetch_data, url_id, delay): url_id
+                for url_id, delay in tasks
+            }
+            
+            for future in as_completed(future_to_url):
+                try:
+                    results.append(future.result())
+                except Exception as e:
                     results.append({
-                        'url_id': url_id,
+                        'url_id': future_to_url[future],
                         'error': str(e),
                         'status': 'error'
                     })
         
-        # 创建多个数据获取任务
-        tasks = [(i, random.uniform(0.5, 2.0)) for i in range(1, 6)]
-        threads = []
-        
-        start_time = time.time()
-        
-        for url_id, delay in tasks:
-            thread = threading.Thread(
-                target=worker_wrapper,
-                args=(url_id, delay),
-                name=f"Fetcher-{url_id}"
-            )
-            threads.append(thread)
-            thread.start()
-        
-        # 等待所有线程完成
-        for thread in threads:
-            thread.join()
-        
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 显示结果
         print(f"\n📊 数据获取结果:")
@@ -198,20 +192,23 @@ class BasicThreadDemo:
         print("🔄 线程生命周期演示")
         print(f"{'='*50}")
         
-        def long_running_task(task_name: str, duration: int):
+        def long_running_task(task_name: str, duration: int, step: float = 0.1):
             """长时间运行的任务"""
-            print(f"[{task_name}] 任务开始 - 状态: {threading.current_thread().is_alive()}")
+            logger.info("[%s] 任务开始 - 状态: %s", task_name, threading.current_thread().is_alive())
             
             for i in range(duration):
-                time.sleep(1)
-                print(f"[{task_name}] 进度: {i+1}/{duration} - 线程ID: {threading.get_ident()}")
+                time.sleep(step)
+                logger.info("[%s] 进度: %d/%d - 线程ID: %d", task_name, i + 1, duration, threading.get_ident())
             
-            print(f"[{task_name}] 任务完成")
+            logger.info("[%s] 任务完成", task_name)
+        
+        # 每个进度步长0.1秒，足以展示生命周期各阶段而不拖慢演示
+        step = 0.1
         
         # 创建线程
         thread = threading.Thread(
             target=long_running_task,
-            args=("LifecycleDemo", 3),
+            args=("LifecycleDemo", 3, step),
             name="LifecycleThread"
         )
         
@@ -225,7 +222,7 @@ class BasicThreadDemo:
         
         # 主线程继续执行其他工作
         print("主线程执行其他工作...")
-        time.sleep(1)
+        time.sleep(step)
         print(f"检查线程状态 - 存活状态: {thread.is_alive()}")
         
         # 等待线程完成
@@ -253,6 +250,8 @@ class BasicThreadDemo:
 
 def main():
     """主函数"""
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s',
+                        datefmt='%H:%M:%S', stream=sys.stdout)
     demo = BasicThreadDemo()
     demo.run_all_demos()
 
@@ -124,7 +124,7 @@ class DataProcessor:
     
     def process_sales_analytics(self, chunk: DataChunk) -> Dict[str, Any]:
         """处理销售数据分析"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             print(f"[{threading.current_thread().name}] 开始处理 {chunk.chunk_id} ({len(chunk)} 条记录)")
@@ -170,7 +170,7 @@ class DataProcessor:
             
             chunk.result = result
             chunk.processed = True
-            chunk.processing_time = time.time() - start_time
+            chunk.processing_time = time.perf_counter() - start_time
             
             print(f"[{threading.current_thread().name}] ✅ {chunk.chunk_id} 处理完成 "
                   f"(耗时: {chunk.processing_time:.2f}s)")
@@ -179,13 +179,13 @@ class DataProcessor:
             
         except Exception as e:
             chunk.error = str(e)
-            chunk.processing_time = time.time() - start_time
+            chunk.processing_time = time.perf_counter() - start_time
             print(f"[{threading.current_thread().name}] ❌ {chunk.chunk_id} 处理失败: {e}")
             raise
     
     def process_log_analytics(self, chunk: DataChunk) -> Dict[str, Any]:
         """处理日志数据分析"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             print(f"[{threading.current_thread().name}] 开始分析 {chunk.chunk_id} ({len(chunk)} 条日志)")
@@ -229,7 +229,7 @@ class DataProcessor:
             
             chunk.result = result
             chunk.processed = True
-            chunk.processing_time = time.time() - start_time
+            chunk.processing_time = time.perf_counter() - start_time
             
             print(f"[{threading.current_thread().name}] ✅ {chunk.chunk_id} 分析完成 "
                   f"(耗时: {chunk.processing_time:.2f}s)")
@@ -238,7 +238,7 @@ class DataProcessor:
             
         except Exception as e:
             chunk.error = str(e)
-            chunk.processing_time = time.time() - start_time
+            chunk.processing_time = time.perf_counter() - start_time
             print(f"[{threading.current_thread().name}] ❌ {chunk.chunk_id} 分析失败: {e}")
             raise
     
@@ -246,7 +246,7 @@ class DataProcessor:
                           processor_func: Callable[[DataChunk], Dict[str, Any]]) -> Dict[str, Any]:
         """并行处理数据"""
         self.processing_stats['total_records'] = len(data)
-        self.processing_stats['start_time'] = time.time()
+        self.processing_stats['start_time'] = time.perf_counter()
         
         print(f"\n🚀 开始并行处理 {len(data):,} 条数据")
         print("=" * 60)
@@ -291,7 +291,7 @@ class DataProcessor:
                         })
                     print(f"❌ 块处理失败: {chunk.chunk_id} - {e}")
         
-        self.processing_stats['end_time'] = time.time()
+        self.processing_stats['end_time'] = time.perf_counter()
         
         # 聚合结果
         aggregated_result = self._aggregate_results(results, chunks)
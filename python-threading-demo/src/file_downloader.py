@@ -200,7 +200,7 @@ class FileDownloader:
         print("=" * 60)
         
         results = []
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # 提交所有下载任务
@@ -232,7 +232,7 @@ class FileDownloader:
                         'error': str(e)
                     })
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 统计结果
         self._print_download_summary(results, end_time - start_time)
@@ -275,7 +275,7 @@ class FileDownloader:
                 pbar.close()
                 raise e
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = [
@@ -290,7 +290,7 @@ class FileDownloader:
                 except Exception as e:
                     print(f"\n❌ 下载异常: {e}")
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 清理进度条
         for pbar in progress_bars.values():
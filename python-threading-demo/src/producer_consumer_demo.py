@@ -90,33 +90,32 @@ class ProducerConsumerDemo:
             """消费者函数"""
             print(f"[{name}] 开始消费...")
             while True:
-                try:
-                    # 获取任务，超时5秒
-                    item = task_queue.get(timeout=5)
-                    
-                    # 模拟处理时间
-                    processing_time = random.uniform(0.2, 0.8)
-                    time.sleep(processing_time)
-                    
-                    # 保存结果
-                    result = {
-                        'consumer': name,
-                        'item': item,
-                        'processing_time': processing_time,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    
-                    with results_lock:
-                        results.append(result)
-                    
-                    print(f"[{name}] 消费: {item} (耗时: {processing_time:.2f}秒)")
-                    
-                    # 标记任务完成
+                # 阻塞获取任务，收到结束标记(None)时退出，无需超时轮询
+                item = task_queue.get()
+                if item is None:
                     task_queue.task_done()
-                    
-                except queue.Empty:
-                    print(f"[{name}] 队列为空，消费者退出")
+                    print(f"[{name}] 收到结束信号，消费者退出")
                     break
+                
+                # 模拟处理时间
+                processing_time = random.uniform(0.2, 0.8)
+                time.sleep(processing_time)
+                
+                # 保存结果
+                result = {
+                    'consumer': name,
+                    'item': item,
+                    'processing_time': processing_time,
+                    'timestamp': datetime.now().isoformat()
+                }
+                
+                with results_lock:
+                    results.append(result)
+                
+                print(f"[{name}] 消费: {item} (耗时: {processing_time:.2f}秒)")
+                
+                # 标记任务完成
+                task_queue.task_done()
         
         # 创建线程
         producers = [
@@ -131,7 +130,7 @@ class ProducerConsumerDemo:
         ]
         
         # 启动所有线程
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for p in producers:
             p.start()
@@ -145,6 +144,10 @@ class ProducerConsumerDemo:
         
         print("\n📦 所有生产者完成，等待消费者处理完所有任务...")
         
+        # 每个消费者一个结束标记，排在所有任务之后
+        for _ in consumers:
+            task_queue.put(None)
+        
         # 等待所有任务被消费
         task_queue.join()
         
@@ -152,7 +155,7 @@ class ProducerConsumerDemo:
         for c in consumers:
             c.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 统计结果
         print(f"\n📊 执行统计:")
@@ -253,7 +256,7 @@ class ProducerConsumerDemo:
         ]
         
         # 启动线程
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         producer_thread.start()
         for c in consumer_threads:
@@ -266,7 +269,7 @@ class ProducerConsumerDemo:
         for c in consumer_threads:
             c.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 分析结果
         print(f"\n📊 优先级队列执行分析:")
@@ -312,7 +315,7 @@ class ProducerConsumerDemo:
         
         # 创建队列和同步对象
         task_queue = queue.Queue(maxsize=20)
-        results_queue = queue.Queue()
+        results = []  # 多个消费者共享，追加时持有stats_lock
         stop_event = threading.Event()
         
         # 统计数据
@@ -334,7 +337,7 @@ class ProducerConsumerDemo:
                     'producer_id': producer_id,
                     'task_number': i + 1,
                     'data': f"Task data from {name}",
-                    'created_at': time.time()
+                    'enqueued_perf': time.perf_counter()  # 仅用于计算等待时间的单调计时，不是时间戳
                 }
                 
                 try:
@@ -361,14 +364,14 @@ class ProducerConsumerDemo:
             while not stop_event.is_set():
                 try:
                     task_data = task_queue.get(timeout=1)
-                    start_time = time.time()
+                    start_time = time.perf_counter()
                     
                     # 模拟处理
                     processing_time = random.uniform(0.2, 0.8)
                     time.sleep(processing_time)
                     
                     # 计算等待时间
-                    wait_time = start_time - task_data['created_at']
+                    wait_time = start_time - task_data['enqueued_perf']
                     
                     result = {
                         'consumer_id': consumer_id,
@@ -379,7 +382,8 @@ class ProducerConsumerDemo:
                         'completed_at': time.time()
                     }
                     
-                    results_queue.put(result)
+                    with stats_lock:
+                        results.append(result)
                     consumed += 1
                     total_processing_time += processing_time
                     
@@ -412,7 +416,7 @@ class ProducerConsumerDemo:
         ]
         
         # 启动所有线程
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for p in producers:
             p.start()
@@ -435,12 +439,7 @@ class ProducerConsumerDemo:
         for c in consumers:
             c.join(timeout=2)
         
-        end_time = time.time()
-        
-        # 收集所有结果
-        results = []
-        while not results_queue.empty():
-            results.append(results_queue.get())
+        end_time = time.perf_counter()
         
         # 统计分析
         print(f"\n📊 多生产者多消费者统计:")
@@ -3,6 +3,7 @@
 展示concurrent.futures模块的ThreadPoolExecutor使用
 """
 
+import asyncio
 import concurrent.futures
 import threading
 import time
@@ -47,11 +48,54 @@ except ImportError:
     psutil = MockPsutil()
 
 
+def is_prime(num: int) -> bool:
+    """判断素数：只试除奇数因子，且上界用整数平方根，避免浮点运算"""
+    if num < 2:
+        return False
+    if num % 2 == 0:
+        return num == 2
+    for i in range(3, math.isqrt(num) + 1, 2):
+        if num % i == 0:
+            return False
+    return True
+
+
+def available_cpus() -> int:
+    """当前进程可用的CPU数：容器/taskset限制下以CPU亲和性为准，不支持的平台退回cpu_count"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def compute_pool_size(kind: str) -> int:
+    """按任务类型计算线程池大小：CPU密集型受GIL限制取核心数，IO密集型取核心数的5倍"""
+    cpu_count = available_cpus()
+    return cpu_count if kind == 'cpu' else cpu_count * 5
+
+
+def warm_up_pool(executor: concurrent.futures.ThreadPoolExecutor, worker_count: int,
+                 timeout: float = 5.0) -> int:
+    """预先启动线程池的全部工作线程，避免计时区间包含线程创建开销，返回参与预热的线程数"""
+    # 每个预热任务都阻塞在屏障上，线程池没有空闲线程可复用，只能逐个创建新线程
+    barrier = threading.Barrier(worker_count)
+    
+    def wait_ready(_: int) -> int:
+        try:
+            barrier.wait(timeout)
+        except threading.BrokenBarrierError:
+            # worker_count超过线程池容量时屏障无法凑齐，超时后放弃预热而不是永久阻塞
+            pass
+        return threading.get_ident()
+    
+    return len(set(executor.map(wait_ready, range(worker_count))))
+
+
 class ThreadPoolDemo:
     """线程池使用演示类"""
     
     def __init__(self):
-        self.cpu_count = os.cpu_count()
+        self.cpu_count = available_cpus()
         print(f"🖥️  检测到CPU核心数: {self.cpu_count}")
     
     def batch_processing(self) -> None:
@@ -62,15 +106,7 @@ class ThreadPoolDemo:
         
         def cpu_intensive_task(n: int) -> Dict[str, Any]:
             """CPU密集型任务：计算素数"""
-            start_time = time.time()
-            
-            def is_prime(num):
-                if num < 2:
-                    return False
-                for i in range(2, int(math.sqrt(num)) + 1):
-                    if num % i == 0:
-                        return False
-                return True
+            start_time = time.perf_counter()
             
             # 查找前n个素数
             primes = []
@@ -80,7 +116,7 @@ class ThreadPoolDemo:
                     primes.append(num)
                 num += 1
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             return {
                 'task_id': f"Task-{n}",
@@ -97,21 +133,24 @@ class ThreadPoolDemo:
         
         # 串行处理（对比）
         print(f"\n🔄 串行处理:")
-        start_time = time.time()
+        start_time = time.perf_counter()
         serial_results = []
         for task in tasks:
             result = cpu_intensive_task(task)
             serial_results.append(result)
             print(f"  ✅ {result['task_id']} 完成，耗时: {result['execution_time']:.2f}秒")
         
-        serial_time = time.time() - start_time
+        serial_time = time.perf_counter() - start_time
         print(f"串行总耗时: {serial_time:.2f}秒")
         
         # 线程池并行处理
-        print(f"\n⚡ 线程池并行处理 (max_workers={self.cpu_count}):")
-        start_time = time.time()
+        max_workers = compute_pool_size('cpu')
+        print(f"\n⚡ 线程池并行处理 (max_workers={max_workers}):")
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.cpu_count) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            warm_up_pool(executor, max_workers)
+            start_time = time.perf_counter()
+            
             # 提交所有任务
             future_to_task = {
                 executor.submit(cpu_intensive_task, task): task 
@@ -128,7 +167,7 @@ class ThreadPoolDemo:
                 except Exception as e:
                     print(f"  ❌ Task-{task} 失败: {e}")
         
-        parallel_time = time.time() - start_time
+        parallel_time = time.perf_counter() - start_time
         print(f"并行总耗时: {parallel_time:.2f}秒")
         
         # 性能对比
@@ -137,7 +176,7 @@ class ThreadPoolDemo:
         print(f"  串行耗时: {serial_time:.2f}秒")
         print(f"  并行耗时: {parallel_time:.2f}秒")
         print(f"  加速比: {speedup:.2f}x")
-        print(f"  效率: {(speedup / self.cpu_count) * 100:.1f}%")
+        print(f"  效率: {(speedup / max_workers) * 100:.1f}%")
     
     def result_collection(self) -> List[Dict[str, Any]]:
         """结果收集和异常处理演示"""
@@ -145,18 +184,16 @@ class ThreadPoolDemo:
         print("🎯 结果收集和异常处理演示")
         print(f"{'='*50}")
         
-        def unreliable_task(task_id: int) -> Dict[str, Any]:
+        def unreliable_task(task_id: int, delay: float, should_fail: bool, value: int) -> Dict[str, Any]:
             """不稳定的任务（可能失败）"""
-            delay = random.uniform(0.5, 2.0)
             time.sleep(delay)
             
-            # 30%的概率失败
-            if random.random() < 0.3:
+            if should_fail:
                 raise Exception(f"Task {task_id} 随机失败")
             
             return {
                 'task_id': task_id,
-                'result': random.randint(1, 100),
+                'result': value,
                 'execution_time': delay,
                 'status': 'success'
             }
@@ -165,30 +202,62 @@ class ThreadPoolDemo:
         results = []
         errors = []
         
+        # 随机参数在主线程预先生成（30%的概率失败），避免工作线程争用random模块的全局锁
+        task_params = {
+            task_id: (random.uniform(0.5, 2.0), random.random() < 0.3, random.randint(1, 100))
+            for task_id in tasks
+        }
+        
         print(f"📋 提交 {len(tasks)} 个任务到线程池...")
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            # 提交所有任务并获取Future对象
-            future_to_task = {
-                executor.submit(unreliable_task, task_id): task_id 
-                for task_id in tasks
-            }
+        def collect(future: concurrent.futures.Future) -> None:
+            """处理一个已完成的任务结果"""
+            task_id = future_to_task[future]
+            try:
+                result = future.result()
+                results.append(result)
+                print(f"  ✅ Task-{task_id}: 结果={result['result']}, 耗时={result['execution_time']:.2f}秒")
+            except Exception as e:
+                error_info = {'task_id': task_id, 'error': str(e), 'type': type(e).__name__}
+                errors.append(error_info)
+                print(f"  ❌ Task-{task_id}: {e}")
+        
+        # 任务主要耗时在等待上，按IO密集型计算线程数
+        # 不使用with语句：with退出时会等待所有任务结束，超时后就无法提前返回
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=compute_pool_size('io'))
+        
+        # 提交所有任务并获取Future对象
+        future_to_task = {
+            executor.submit(unreliable_task, task_id, *task_params[task_id]): task_id 
+            for task_id in tasks
+        }
+        
+        # 按完成顺序处理结果，所有任务共享一个5秒的总超时
+        deadline = time.perf_counter() + 5
+        pending = set(future_to_task)
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
             
-            # 使用as_completed获取完成的任务
-            for future in concurrent.futures.as_completed(future_to_task):
+            done, pending = concurrent.futures.wait(
+                pending, timeout=remaining,
+                return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                collect(future)
+        
+        # 超过总时限：尚未开始的任务直接取消，仍在运行的任务不再等待，二者都记为超时
+        for future in pending:
+            if future.cancel() or not future.done():
                 task_id = future_to_task[future]
-                try:
-                    result = future.result(timeout=5)  # 5秒超时
-                    results.append(result)
-                    print(f"  ✅ Task-{task_id}: 结果={result['result']}, 耗时={result['execution_time']:.2f}秒")
-                except concurrent.futures.TimeoutError:
-                    error_info = {'task_id': task_id, 'error': 'Timeout', 'type': 'TimeoutError'}
-                    errors.append(error_info)
-                    print(f"  ⏰ Task-{task_id}: 超时")
-                except Exception as e:
-                    error_info = {'task_id': task_id, 'error': str(e), 'type': type(e).__name__}
-                    errors.append(error_info)
-                    print(f"  ❌ Task-{task_id}: {e}")
+                error_info = {'task_id': task_id, 'error': 'Timeout', 'type': 'TimeoutError'}
+                errors.append(error_info)
+                print(f"  ⏰ Task-{task_id}: 超时")
+            else:
+                collect(future)  # 恰好在时限之后完成
+        
+        executor.shutdown(wait=False)
         
         # 统计结果
         print(f"\n📊 执行统计:")
@@ -213,9 +282,9 @@ class ThreadPoolDemo:
         
         def io_bound_task(task_id: int, delay: float) -> Dict[str, Any]:
             """IO密集型任务模拟"""
-            start_time = time.time()
+            start_time = time.perf_counter()
             time.sleep(delay)  # 模拟IO等待
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             return {
                 'task_id': task_id,
@@ -234,9 +303,10 @@ class ThreadPoolDemo:
         for pool_size in pool_sizes:
             print(f"\n🔧 测试线程池大小: {pool_size}")
             
-            start_time = time.time()
-            
             with concurrent.futures.ThreadPoolExecutor(max_workers=pool_size) as executor:
+                warm_up_pool(executor, pool_size)
+                start_time = time.perf_counter()
+                
                 futures = [
                     executor.submit(io_bound_task, i, task_delay)
                     for i in range(1, task_count + 1)
@@ -250,7 +320,7 @@ class ThreadPoolDemo:
                     except Exception as e:
                         print(f"  ❌ 任务失败: {e}")
             
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
             
             # 分析线程使用情况
             unique_threads = len(set(r['thread_id'] for r in results))
@@ -284,15 +354,54 @@ class ThreadPoolDemo:
         print(f"\n🏆 最优配置: 线程池大小 {best_config['pool_size']}, "
               f"效率 {best_config['efficiency']:.1%}")
     
+    def async_io_demo(self, task_count: int = 20, task_delay: float = 0.5) -> List[Dict[str, Any]]:
+        """asyncio协程处理IO密集型任务演示（与线程池方案对比）"""
+        print(f"\n{'='*50}")
+        print("🌀 asyncio协程IO演示")
+        print(f"{'='*50}")
+        
+        async def io_bound_task_async(task_id: int, delay: float) -> Dict[str, Any]:
+            """IO密集型任务模拟（协程版本）"""
+            start_time = time.perf_counter()
+            await asyncio.sleep(delay)  # 模拟IO等待，不占用线程
+            end_time = time.perf_counter()
+            
+            return {
+                'task_id': task_id,
+                'delay': delay,
+                'actual_time': end_time - start_time,
+                'thread_id': threading.get_ident()
+            }
+        
+        async def run_all() -> List[Dict[str, Any]]:
+            return await asyncio.gather(*(
+                io_bound_task_async(i, task_delay)
+                for i in range(1, task_count + 1)
+            ))
+        
+        print(f"📋 在单个线程中并发执行 {task_count} 个IO任务 (每个 {task_delay}秒)")
+        
+        start_time = time.perf_counter()
+        results = asyncio.run(run_all())
+        total_time = time.perf_counter() - start_time
+        
+        unique_threads = len(set(r['thread_id'] for r in results))
+        
+        print(f"  ⏱️  总耗时: {total_time:.2f}秒 (串行需要 {task_count * task_delay:.2f}秒)")
+        print(f"  🧵 使用线程数: {unique_threads}")
+        print("  💡 协程等待IO时不占用线程，适合大量并发IO；CPU密集型任务仍需多进程")
+        
+        return results
+    
     def monitor_thread_pool(self) -> None:
         """线程池监控演示"""
         print(f"\n{'='*50}")
         print("📊 线程池监控演示")
         print(f"{'='*50}")
         
-        def monitored_task(task_id: int) -> Dict[str, Any]:
+        def monitored_task(task_id: int, delay: float) -> Dict[str, Any]:
             """被监控的任务"""
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # 模拟不同类型的工作负载
             if task_id % 3 == 0:
@@ -300,13 +409,13 @@ class ThreadPoolDemo:
                 total = sum(i * i for i in range(10000))
             elif task_id % 3 == 1:
                 # IO密集型
-                time.sleep(random.uniform(0.5, 1.5))
+                time.sleep(delay)
             else:
                 # 混合型
-                time.sleep(random.uniform(0.1, 0.3))
+                time.sleep(delay)
                 total = sum(i for i in range(5000))
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             return {
                 'task_id': task_id,
@@ -328,13 +437,20 @@ class ThreadPoolDemo:
         print("🔍 开始监控线程池执行...")
         print_system_stats()
         
-        start_time = time.time()
+        # IO型任务休眠0.5-1.5秒，混合型0.1-0.3秒，在提交前统一生成
+        delays = {
+            i: random.uniform(0.5, 1.5) if i % 3 == 1 else random.uniform(0.1, 0.3)
+            for i in range(1, 21)
+        }
+        
+        start_time = time.perf_counter()
         completed_tasks = 0
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        # 混合负载中IO等待占多数，按IO密集型计算线程数
+        with concurrent.futures.ThreadPoolExecutor(max_workers=compute_pool_size('io')) as executor:
             # 提交任务
             futures = [
-                executor.submit(monitored_task, i)
+                executor.submit(monitored_task, i, delays[i])
                 for i in range(1, 21)  # 20个任务
             ]
             
@@ -345,7 +461,7 @@ class ThreadPoolDemo:
                     completed_tasks += 1
                     
                     if completed_tasks % 5 == 0:  # 每完成5个任务打印一次状态
-                        elapsed = time.time() - start_time
+                        elapsed = time.perf_counter() - start_time
                         print(f"\n⏳ 进度: {completed_tasks}/20 任务完成 (耗时: {elapsed:.1f}秒)")
                         print_system_stats()
                         
@@ -357,7 +473,7 @@ class ThreadPoolDemo:
                 except Exception as e:
                     print(f"❌ 任务失败: {e}")
         
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         print(f"\n✅ 所有任务完成，总耗时: {total_time:.2f}秒")
         print_system_stats()
     
@@ -370,6 +486,7 @@ class ThreadPoolDemo:
             self.batch_processing()
             self.result_collection()
             self.dynamic_pool_sizing()
+            self.async_io_demo()
             self.monitor_thread_pool()
             
             print(f"\n{'='*60}")
@@ -41,7 +41,7 @@ class ThreadSyncDemo:
             thread = threading.Thread(target=unsafe_increment, args=(f"UnsafeWorker-{i+1}", 1000))
             threads.append(thread)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         for thread in threads:
             thread.start()
         for thread in threads:
@@ -75,7 +75,7 @@ class ThreadSyncDemo:
         for thread in threads:
             thread.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         print(f"有锁结果: {safe_counter['value']} (期望: 3000)")
         print(f"执行时间: {end_time - start_time:.2f}秒")
@@ -113,14 +113,14 @@ class ThreadSyncDemo:
             )
             threads.append(thread)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         for thread in threads:
             thread.start()
         
         for thread in threads:
             thread.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         print(f"\n📊 递归锁执行结果:")
         print(f"  执行时间: {end_time - start_time:.2f}秒")
@@ -194,7 +194,7 @@ class ThreadSyncDemo:
             for i in range(2)
         ]
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # 启动线程
         producer_thread.start()
@@ -206,7 +206,7 @@ class ThreadSyncDemo:
         for thread in consumer_threads:
             thread.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         print(f"\n📊 Condition演示结果:")
         print(f"  执行时间: {end_time - start_time:.2f}秒")
@@ -219,8 +219,9 @@ class ThreadSyncDemo:
         print("📢 Event事件同步演示")
         print(f"{'='*50}")
         
-        # 创建事件对象
-        start_event = threading.Event()
+        # 同步对象：Barrier让所有worker与协调器同时出发，Event用于广播停止信号
+        worker_count = 4
+        start_barrier = threading.Barrier(worker_count + 1)  # 所有worker + 协调器
         stop_event = threading.Event()
         
         # 工作结果收集
@@ -230,15 +231,17 @@ class ThreadSyncDemo:
         def worker(name: str, work_duration: float):
             """工作线程"""
             print(f"[{name}] 等待开始信号...")
-            start_event.wait()  # 等待开始信号
+            start_barrier.wait()  # 等待所有参与者到齐
             
             print(f"[{name}] 收到开始信号，开始工作...")
             
             # 模拟工作过程
             work_progress = 0
             step = 0.1
-            while work_progress < work_duration and not stop_event.is_set():
-                time.sleep(step)
+            while work_progress < work_duration:
+                # 在停止事件上等待一个步长：收到停止信号时立即唤醒，无需轮询
+                if stop_event.wait(timeout=step):
+                    break
                 work_progress += step
                 
                 if int(work_progress * 10) % 10 == 0:  # 每秒报告进度
@@ -264,10 +267,8 @@ class ThreadSyncDemo:
         def coordinator():
             """协调器线程"""
             print("[Coordinator] 准备启动所有工作线程...")
-            time.sleep(1)  # 确保所有worker都在等待
-            
-            print("[Coordinator] 发送开始信号！")
-            start_event.set()  # 发送开始信号
+            start_barrier.wait()  # 所有worker到齐后同时放行，无需猜测等待时间
+            print("[Coordinator] 所有线程已就绪，开始工作！")
             
             # 让工作线程运行一段时间
             time.sleep(3)
@@ -278,13 +279,13 @@ class ThreadSyncDemo:
         # 创建工作线程
         workers = [
             threading.Thread(target=worker, args=(f"Worker-{i+1}", random.uniform(2, 5)))
-            for i in range(4)
+            for i in range(worker_count)
         ]
         
         coordinator_thread = threading.Thread(target=coordinator)
         
         # 启动所有线程
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for w in workers:
             w.start()
@@ -296,7 +297,7 @@ class ThreadSyncDemo:
         for w in workers:
             w.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 分析结果
         print(f"\n📊 Event同步结果:")
@@ -325,8 +326,9 @@ class ThreadSyncDemo:
         semaphore = threading.Semaphore(resource_pool_size)
         
         # 资源使用统计
-        resource_usage = {'current': 0, 'max_used': 0, 'total_requests': 0}
+        resource_usage = {'current': 0, 'max_used': 0, 'total_requests': 0, 'finished': 0, 'total_wait': 0.0}
         usage_lock = threading.Lock()
+        all_done = threading.Event()  # 最后一个工作线程完成时触发
         
         def use_resource(name: str, work_duration: float):
             """使用有限资源的工作函数"""
@@ -335,11 +337,14 @@ class ThreadSyncDemo:
             
             print(f"[{name}] 请求资源...")
             
-            # 获取资源
+            # 获取资源，记录在信号量上阻塞的时间
+            wait_start = time.perf_counter()
             semaphore.acquire()
+            wait_time = time.perf_counter() - wait_start
             
             try:
                 with usage_lock:
+                    resource_usage['total_wait'] += wait_time
                     resource_usage['current'] += 1
                     if resource_usage['current'] > resource_usage['max_used']:
                         resource_usage['max_used'] = resource_usage['current']
@@ -355,12 +360,15 @@ class ThreadSyncDemo:
             finally:
                 with usage_lock:
                     resource_usage['current'] -= 1
+                    resource_usage['finished'] += 1
+                    if resource_usage['finished'] == len(work_durations):
+                        all_done.set()
                 semaphore.release()
         
         # 创建更多的工作线程（超过资源数量）
+        work_durations = [random.uniform(1, 3) for _ in range(8)]  # 8个线程竞争3个资源
         workers = []
-        for i in range(8):  # 8个线程竞争3个资源
-            work_duration = random.uniform(1, 3)
+        for i, work_duration in enumerate(work_durations):
             thread = threading.Thread(
                 target=use_resource,
                 args=(f"Worker-{i+1}", work_duration)
@@ -369,16 +377,15 @@ class ThreadSyncDemo:
         
         print(f"🚀 启动 {len(workers)} 个工作线程竞争 {resource_pool_size} 个资源")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # 启动所有线程
         for worker in workers:
             worker.start()
         
-        # 监控资源使用情况
+        # 监控资源使用情况：每0.5秒报告一次，全部完成时立即被唤醒，无需逐个检查线程状态
         monitor_duration = 0
-        while any(w.is_alive() for w in workers):
-            time.sleep(0.5)
+        while not all_done.wait(timeout=0.5):
             monitor_duration += 0.5
             with usage_lock:
                 current_usage = resource_usage['current']
@@ -388,7 +395,7 @@ class ThreadSyncDemo:
         for worker in workers:
             worker.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # 统计结果
         print(f"\n📊 Semaphore资源管理结果:")
@@ -397,7 +404,7 @@ class ThreadSyncDemo:
         print(f"  总请求数: {resource_usage['total_requests']}")
         print(f"  最大并发使用: {resource_usage['max_used']}")
         print(f"  资源利用率: {(resource_usage['max_used'] / resource_pool_size) * 100:.1f}%")
-        print(f"  平均等待时间: {((end_time - start_time) - sum(random.uniform(1, 3) for _ in range(8))) / 8:.2f}秒")
+        print(f"  平均等待时间: {resource_usage['total_wait'] / len(workers):.2f}秒")
     
     def deadlock_demo(self) -> None:
         """死锁演示和避免"""
@@ -460,7 +467,7 @@ class ThreadSyncDemo:
         thread1 = threading.Thread(target=worker1)
         thread2 = threading.Thread(target=worker2)
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         thread1.start()
         thread2.start()
@@ -468,7 +475,7 @@ class ThreadSyncDemo:
         thread1.join()
         thread2.join()
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         print(f"\n✅ 死锁避免演示完成，耗时: {end_time - start_time:.2f}秒")
         print("💡 避免死锁的方法:")
@@ -16,7 +16,7 @@ import shutil
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.basic_thread_demo import BasicThreadDemo
-from src.thread_pool_demo import ThreadPoolDemo
+from src.thread_pool_demo import ThreadPoolDemo, is_prime, warm_up_pool
 from src.producer_consumer_demo import ProducerConsumerDemo, Task, TaskPriority
 from src.thread_sync_demo import ThreadSyncDemo
 from src.file_downloader import FileDownloader, DownloadTask
@@ -73,6 +73,37 @@ class TestThreadPoolDemo(unittest.TestCase):
         # 验证结果中包含成功和可能的失败项
         successful_results = [r for r in results if r.get('status') == 'success']
         self.assertGreater(len(successful_results), 0)
+    
+    def test_async_io_demo(self):
+        """测试asyncio协程IO演示"""
+        results = self.demo.async_io_demo(task_count=5, task_delay=0.01)
+        
+        self.assertEqual(len(results), 5)
+        self.assertEqual([r['task_id'] for r in results], [1, 2, 3, 4, 5])
+        # 所有协程都在同一个线程中执行
+        self.assertEqual(len(set(r['thread_id'] for r in results)), 1)
+    
+    def test_is_prime(self):
+        """测试素数判断"""
+        primes = [n for n in range(50) if is_prime(n)]
+        
+        self.assertEqual(primes, [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47])
+        self.assertTrue(is_prime(7919))
+        self.assertFalse(is_prime(7917))
+    
+    def test_warm_up_pool(self):
+        """测试线程池预热会启动全部工作线程"""
+        import concurrent.futures
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(warm_up_pool(executor, 4), 4)
+        
+        # 预热数量超过线程池容量时应超时返回，而不是死锁
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            start_time = time.perf_counter()
+            started = warm_up_pool(executor, 3, timeout=0.2)
+            self.assertLessEqual(started, 2)
+            self.assertLess(time.perf_counter() - start_time, 2)
 
 
 class TestProducerConsumerDemo(unittest.TestCase):